@@ -1,6 +1,8 @@
-import React, { useState } from 'react';
+import React, { useState, useEffect } from 'react';
 import { MockUser } from '../mockAuth';
 import { mockAuth } from '../mockAuth';
+import { CARBON_API_URL, SOLAR_API_URL, preconnect } from '../lib/api';
+import { logger } from '../lib/logger';
 import SolarEnergy from './modules/SolarEnergy';
 import CarbonFootprint from './modules/CarbonFootprint';
 import WaterTracker from './modules/WaterTracker';
@@ -14,11 +16,17 @@ interface DashboardProps {
 const Dashboard: React.FC<DashboardProps> = ({ user }) => {
   const [activeModule, setActiveModule] = useState('solar');
 
+  // Warm up both backends so the first analysis doesn't pay for connection setup
+  useEffect(() => {
+    preconnect(CARBON_API_URL);
+    preconnect(SOLAR_API_URL);
+  }, []);
+
   const handleSignOut = async () => {
     try {
       await mockAuth.signOut();
     } catch (error) {
-      console.error('Error signing out:', error);
+      logger.error('Error signing out:', error);
     }
   };
 
@@ -17,8 +17,12 @@ import {
   Target,
   TrendingUp,
   Download,
-  Share2
+  Share2,
+  RefreshCw
 } from 'lucide-react';
+import { ApiError, CARBON_API_URL, fetchWithRetry, isQuotaExceeded } from '../../lib/api';
+import { logger } from '../../lib/logger';
+import { ResponseCache } from '../../lib/responseCache';
 import './CarbonFootprint.css';
 
 interface CarbonFootprintData {
@@ -61,8 +65,149 @@ interface CarbonFootprintData {
 interface UploadedImage {
   file: File;
   preview: string;
+  hash: Promise<string | null>;
 }
 
+// Static step list and animation variants, defined once rather than per render
+const analysisSteps = [
+  { label: 'Image Processing', icon: Camera, description: 'Analyzing product image...' },
+  { label: 'Entity Standardization', icon: Target, description: 'Standardizing product information...' },
+  { label: 'Knowledge Retrieval', icon: BarChart3, description: 'Retrieving carbon footprint data...' },
+  { label: 'Footprint Estimation', icon: Leaf, description: 'Calculating detailed breakdown...' },
+  { label: 'Final Summary', icon: Check, description: 'Generating complete analysis...' }
+];
+
+// Animation variants
+const containerVariants = {
+  hidden: { opacity: 0 },
+  visible: {
+    opacity: 1,
+    transition: {
+      staggerChildren: 0.1,
+      delayChildren: 0.2
+    }
+  }
+};
+
+const itemVariants = {
+  hidden: { opacity: 0, y: 20 },
+  visible: {
+    opacity: 1,
+    y: 0,
+    transition: {
+      duration: 0.5
+    }
+  }
+};
+
+const cardVariants = {
+  hidden: { opacity: 0, scale: 0.95 },
+  visible: {
+    opacity: 1,
+    scale: 1,
+    transition: {
+      duration: 0.4
+    }
+  },
+  hover: {
+    scale: 1.02,
+    transition: {
+      duration: 0.2
+    }
+  }
+};
+
+// The health probe result is reused for a short while, so switching between
+// dashboard modules doesn't hit the backend on every mount
+const BACKEND_HEALTH_KEY = 'carbon-footprint';
+const backendHealthCache = new ResponseCache<boolean>(1, 30 * 1000);
+
+// Backend results keyed by the SHA-256 of the uploaded image, so re-analysing
+// the same photo doesn't re-run the Gemini pipeline
+const analysisCache = new ResponseCache<CarbonFootprintData>(32, 60 * 60 * 1000, 'urjamitra:carbon-analyses');
+
+const hashFile = async (file: File) => {
+  if (!window.crypto?.subtle) {
+    return null;
+  }
+  const digest = await window.crypto.subtle.digest('SHA-256', await file.arrayBuffer());
+  return Array.from(new Uint8Array(digest), byte => byte.toString(16).padStart(2, '0')).join('');
+};
+
+// Formats advertised in the upload zone ("Supports: JPG, PNG, WEBP")
+const SUPPORTED_IMAGE_TYPES = ['image/jpeg', 'image/png', 'image/webp'];
+
+const isSupportedImage = (file: File) => SUPPORTED_IMAGE_TYPES.indexOf(file.type) !== -1;
+
+// The backend falls back to Tesseract OCR on the label text, so small print
+// has to stay legible. The limit sits just above the long edge of a typical
+// 12 MP phone photo (4032 px); only 48 MP+ shots, which are several times the
+// size to upload, get shrunk.
+const MAX_UPLOAD_DIMENSION = 4096;
+
+// Applies EXIF rotation when decoding, so portrait photos aren't uploaded on
+// their side. 'from-image' isn't in this TypeScript version's DOM typings.
+const BITMAP_OPTIONS = { imageOrientation: 'from-image' } as unknown as ImageBitmapOptions;
+
+// Files this small upload quickly whatever their dimensions
+const MIN_DOWNSCALE_BYTES = 1024 * 1024;
+
+// An <img> that is never painted isn't decoded, so this reads the pixel size
+// without allocating a full bitmap for photos that won't be resized
+const readImageSize = (file: File) => new Promise<{ width: number; height: number }>((resolve, reject) => {
+  const url = URL.createObjectURL(file);
+  const image = new Image();
+  image.onload = () => {
+    URL.revokeObjectURL(url);
+    resolve({ width: image.naturalWidth, height: image.naturalHeight });
+  };
+  image.onerror = () => {
+    URL.revokeObjectURL(url);
+    reject(new Error('Unable to read image dimensions'));
+  };
+  image.src = url;
+});
+
+const downscaleImage = async (file: File): Promise<Blob> => {
+  if (file.size < MIN_DOWNSCALE_BYTES) {
+    return file;
+  }
+  try {
+    const { width, height } = await readImageSize(file);
+    const scale = MAX_UPLOAD_DIMENSION / Math.max(width, height);
+    if (scale >= 1) {
+      return file;
+    }
+
+    const bitmap = await createImageBitmap(file, BITMAP_OPTIONS);
+    const canvas = document.createElement('canvas');
+    canvas.width = Math.round(bitmap.width * scale);
+    canvas.height = Math.round(bitmap.height * scale);
+    const context = canvas.getContext('2d');
+    if (!context) {
+      bitmap.close();
+      return file;
+    }
+    context.drawImage(bitmap, 0, 0, canvas.width, canvas.height);
+    bitmap.close();
+
+    // Keep PNG/WEBP so transparency survives; everything else becomes JPEG
+    const type = file.type === 'image/png' || file.type === 'image/webp' ? file.type : 'image/jpeg';
+    const blob = await new Promise<Blob | null>(resolve => canvas.toBlob(resolve, type, 0.9));
+    return blob || file;
+  } catch (error) {
+    // Undecodable in the browser; let the backend deal with the original
+    return file;
+  }
+};
+
+// Badge colours keyed by lowercased confidence level
+const CONFIDENCE_COLORS: Readonly<Record<string, string>> = {
+  high: '#10b981',
+  medium: '#f59e0b',
+  low: '#ef4444'
+};
+
 const CarbonFootprint: React.FC = () => {
   const [uploadedImage, setUploadedImage] = useState<UploadedImage | null>(null);
   const [isDragOver, setIsDragOver] = useState(false);
@@ -71,6 +216,7 @@ const CarbonFootprint: React.FC = () => {
   const [currentStep, setCurrentStep] = useState(0);
   const [error, setError] = useState<string | null>(null);
   const [isBackendConnected, setIsBackendConnected] = useState<boolean | null>(null);
+  const [isCachedResult, setIsCachedResult] = useState(false);
   const fileInputRef = useRef<HTMLInputElement>(null);
 
   // Check backend connectivity on component mount
@@ -79,16 +225,21 @@ const CarbonFootprint: React.FC = () => {
   }, []);
 
   const checkBackendHealth = async () => {
+    const cachedStatus = backendHealthCache.get(BACKEND_HEALTH_KEY);
+    if (cachedStatus !== undefined) {
+      setIsBackendConnected(cachedStatus);
+      return;
+    }
+
+    let isConnected = false;
     try {
-      const response = await fetch('http://localhost:5001/api/health');
-      if (response.ok) {
-        setIsBackendConnected(true);
-      } else {
-        setIsBackendConnected(false);
-      }
+      const response = await fetch(`${CARBON_API_URL}/api/health`);
+      isConnected = response.ok;
     } catch (error) {
-      setIsBackendConnected(false);
+      isConnected = false;
     }
+    backendHealthCache.set(BACKEND_HEALTH_KEY, isConnected);
+    setIsBackendConnected(isConnected);
   };
 
   const testWithSampleImage = async () => {
@@ -108,7 +259,7 @@ const CarbonFootprint: React.FC = () => {
       }, 800);
       
       // Call the test endpoint
-      const response = await fetch('http://localhost:5001/api/test', {
+      const response = await fetchWithRetry(`${CARBON_API_URL}/api/test`, {
         method: 'POST',
       });
       
@@ -116,82 +267,26 @@ const CarbonFootprint: React.FC = () => {
       
       if (!response.ok) {
         const errorData = await response.json();
-        throw new Error(errorData.message || 'Test analysis failed');
+        throw new ApiError(errorData.message || 'Test analysis failed', response.status);
       }
       
-      const results = await response.json();
+      // The test endpoint always returns all five layers, so use it as is
+      const results: CarbonFootprintData = await response.json();
       
       // Ensure we complete all steps
       setCurrentStep(analysisSteps.length - 1);
       
-      // Transform the backend response
-      const transformedResults: CarbonFootprintData = {
-        layer1_input_processing: results.layer1_input_processing,
-        layer2_standardization: results.layer2_standardization,
-        layer3_knowledge_retrieval: results.layer3_knowledge_retrieval,
-        layer4_footprint_estimation: results.layer4_footprint_estimation,
-        layer5_final_summary: results.layer5_final_summary
-      };
-      
       await new Promise(resolve => setTimeout(resolve, 500));
-      setAnalysisResults(transformedResults);
+      setAnalysisResults(results);
       
     } catch (err) {
-      console.error('Test analysis error:', err);
+      logger.error('Test analysis error:', err);
       setError(err instanceof Error ? err.message : 'Failed to run test analysis. Please ensure the backend server is running.');
     } finally {
       setIsAnalyzing(false);
     }
   };
 
-  const analysisSteps = [
-    { label: 'Image Processing', icon: Camera, description: 'Analyzing product image...' },
-    { label: 'Entity Standardization', icon: Target, description: 'Standardizing product information...' },
-    { label: 'Knowledge Retrieval', icon: BarChart3, description: 'Retrieving carbon footprint data...' },
-    { label: 'Footprint Estimation', icon: Leaf, description: 'Calculating detailed breakdown...' },
-    { label: 'Final Summary', icon: Check, description: 'Generating complete analysis...' }
-  ];
-
-  // Animation variants
-  const containerVariants = {
-    hidden: { opacity: 0 },
-    visible: {
-      opacity: 1,
-      transition: {
-        staggerChildren: 0.1,
-        delayChildren: 0.2
-      }
-    }
-  };
-
-  const itemVariants = {
-    hidden: { opacity: 0, y: 20 },
-    visible: {
-      opacity: 1,
-      y: 0,
-      transition: {
-        duration: 0.5
-      }
-    }
-  };
-
-  const cardVariants = {
-    hidden: { opacity: 0, scale: 0.95 },
-    visible: {
-      opacity: 1,
-      scale: 1,
-      transition: {
-        duration: 0.4
-      }
-    },
-    hover: {
-      scale: 1.02,
-      transition: {
-        duration: 0.2
-      }
-    }
-  };
-
   const handleDragOver = useCallback((e: React.DragEvent) => {
     e.preventDefault();
     setIsDragOver(true);
@@ -207,7 +302,7 @@ const CarbonFootprint: React.FC = () => {
     setIsDragOver(false);
     
     const files = Array.from(e.dataTransfer.files);
-    const imageFile = files.find(file => file.type.startsWith('image/'));
+    const imageFile = files.find(isSupportedImage);
     
     if (imageFile) {
       handleImageUpload(imageFile);
@@ -216,29 +311,44 @@ const CarbonFootprint: React.FC = () => {
 
   const handleFileInput = (e: React.ChangeEvent<HTMLInputElement>) => {
     const file = e.target.files?.[0];
-    if (file && file.type.startsWith('image/')) {
+    if (file && isSupportedImage(file)) {
       handleImageUpload(file);
     }
   };
 
   const handleImageUpload = (file: File) => {
     const preview = URL.createObjectURL(file);
-    setUploadedImage({ file, preview });
+    // Start hashing right away so the cache lookup is ready by the time
+    // the user starts the analysis
+    const hash = hashFile(file).catch(() => null);
+    setUploadedImage({ file, preview, hash });
     setError(null);
     setAnalysisResults(null);
   };
 
-  const startAnalysis = async () => {
+  const startAnalysis = async ({ noCache = false } = {}) => {
     if (!uploadedImage) return;
     
     setIsAnalyzing(true);
     setCurrentStep(0);
     setError(null);
+    setAnalysisResults(null);
+    setIsCachedResult(false);
     
     try {
+      // Identical images were already analysed; skip the upload entirely
+      const imageHash = await uploadedImage.hash;
+      const cachedResults = imageHash && !noCache ? analysisCache.get(imageHash) : undefined;
+      if (cachedResults) {
+        setCurrentStep(analysisSteps.length - 1);
+        setAnalysisResults(cachedResults);
+        setIsCachedResult(true);
+        return;
+      }
+
       // Create FormData for image upload
       const formData = new FormData();
-      formData.append('image', uploadedImage.file);
+      formData.append('image', await downscaleImage(uploadedImage.file), uploadedImage.file.name);
       
       // Simulate progress through the steps
       const progressInterval = setInterval(() => {
@@ -251,7 +361,7 @@ const CarbonFootprint: React.FC = () => {
       }, 800);
       
       // Call the real backend API
-      const response = await fetch('http://localhost:5001/api/analyze', {
+      const response = await fetchWithRetry(`${CARBON_API_URL}/api/analyze`, {
         method: 'POST',
         body: formData,
       });
@@ -260,7 +370,7 @@ const CarbonFootprint: React.FC = () => {
       
       if (!response.ok) {
         const errorData = await response.json();
-        throw new Error(errorData.message || 'Analysis failed');
+        throw new ApiError(errorData.message || 'Analysis failed', response.status);
       }
       
       const results = await response.json();
@@ -308,26 +418,35 @@ const CarbonFootprint: React.FC = () => {
       
       // Add a final pause for dramatic effect
       await new Promise(resolve => setTimeout(resolve, 500));
+      // Only complete pipeline runs are worth replaying; a missing layer means
+      // the placeholders above were filled in
+      const isComplete = results.layer1_input_processing && results.layer2_standardization &&
+        results.layer3_knowledge_retrieval && results.layer4_footprint_estimation &&
+        results.layer5_final_summary;
+      if (imageHash && isComplete) {
+        analysisCache.set(imageHash, transformedResults);
+      }
       setAnalysisResults(transformedResults);
       
     } catch (err) {
-      console.error('Analysis error:', err);
-      
       // Check for quota exceeded error
-      if (err instanceof Error && err.message.includes('429')) {
+      if (err instanceof ApiError && isQuotaExceeded(err.status, err.message)) {
         setError('⚠️ API quota exceeded. Please try again later or upgrade your plan. Using demo mode for now.');
-        console.log('Quota exceeded, falling back to demo mode...');
+        logger.info('Quota exceeded, falling back to demo mode...');
+        backendHealthCache.set(BACKEND_HEALTH_KEY, false);
         setIsBackendConnected(false);
         await runDemoAnalysis();
       }
       // If backend is not available, fall back to demo mode
       else if (err instanceof TypeError && err.message.includes('fetch')) {
-        console.log('Backend not available, using demo mode...');
+        logger.info('Backend not available, using demo mode...');
+        backendHealthCache.set(BACKEND_HEALTH_KEY, false);
         setIsBackendConnected(false);
         
         // Run demo analysis
         await runDemoAnalysis();
       } else {
+        logger.error('Analysis error:', err);
         setError(err instanceof Error ? err.message : 'Failed to analyze image. Please try again.');
       }
     } finally {
@@ -402,6 +521,7 @@ const CarbonFootprint: React.FC = () => {
   const resetAnalysis = () => {
     setUploadedImage(null);
     setAnalysisResults(null);
+    setIsCachedResult(false);
     setIsAnalyzing(false);
     setCurrentStep(0);
     setError(null);
@@ -414,14 +534,8 @@ const CarbonFootprint: React.FC = () => {
     return ((value / total) * 100).toFixed(1);
   };
 
-  const getConfidenceColor = (confidence: string) => {
-    switch (confidence.toLowerCase()) {
-      case 'high': return '#10b981';
-      case 'medium': return '#f59e0b';
-      case 'low': return '#ef4444';
-      default: return '#6b7280';
-    }
-  };
+  const getConfidenceColor = (confidence: string) =>
+    CONFIDENCE_COLORS[confidence.toLowerCase()] || '#6b7280';
 
   return (
     <div className="carbon-footprint">
@@ -493,7 +607,7 @@ const CarbonFootprint: React.FC = () => {
                 <input
                   ref={fileInputRef}
                   type="file"
-                  accept="image/*"
+                  accept={SUPPORTED_IMAGE_TYPES.join(',')}
                   onChange={handleFileInput}
                   style={{ display: 'none' }}
                 />
@@ -605,7 +719,7 @@ const CarbonFootprint: React.FC = () => {
                   className="analyze-btn"
                   whileHover={{ scale: 1.02 }}
                   whileTap={{ scale: 0.98 }}
-                  onClick={startAnalysis}
+                  onClick={() => startAnalysis()}
                 >
                   <Zap size={20} />
                   Start Carbon Analysis
@@ -681,6 +795,12 @@ const CarbonFootprint: React.FC = () => {
                   </div>
                 </div>
                 <div className="results-actions">
+                  {isCachedResult && (
+                    <button className="action-btn" onClick={() => startAnalysis({ noCache: true })}>
+                      <RefreshCw size={16} />
+                      Re-analyze
+                    </button>
+                  )}
                   <button className="action-btn">
                     <Download size={16} />
                     Export
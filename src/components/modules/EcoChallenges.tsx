@@ -1,5 +1,6 @@
 import React, { useState, useEffect, useCallback } from 'react';
-import { GoogleGenerativeAI } from '@google/generative-ai';
+import { generateCached } from '../../lib/gemini';
+import { logger } from '../../lib/logger';
 import './EcoChallenges.css';
 
 interface Challenge {
@@ -23,6 +24,37 @@ interface Badge {
   earnedDate?: Date;
 }
 
+// Static part of the suggestions prompt, built once at module load
+const ECO_PROMPT_INSTRUCTIONS = `
+Please provide:
+1. Personalized challenge recommendations based on their progress
+2. Tips to stay motivated
+3. Suggestions for new challenges they might enjoy
+4. Ways to involve family/friends in sustainability efforts
+
+Format your response in an encouraging, actionable way.`;
+
+// Display lookups, built once instead of switching on every render
+const DIFFICULTY_COLORS: Readonly<Record<string, string>> = {
+  easy: '#4CAF50',
+  medium: '#FF9800',
+  hard: '#F44336'
+};
+
+const CATEGORY_ICONS: Readonly<Record<string, string>> = {
+  energy: '⚡',
+  water: '💧',
+  carbon: '🌱',
+  waste: '♻️'
+};
+
+const CATEGORY_COLORS: Readonly<Record<string, string>> = {
+  energy: '#FFC107',
+  water: '#2196F3',
+  carbon: '#4CAF50',
+  waste: '#9C27B0'
+};
+
 const EcoChallenges: React.FC = () => {
   const [challenges, setChallenges] = useState<Challenge[]>([
     {
@@ -123,10 +155,9 @@ const EcoChallenges: React.FC = () => {
   const [totalPoints, setTotalPoints] = useState(0);
   const [completedChallenges, setCompletedChallenges] = useState(0);
   const [aiSuggestions, setAiSuggestions] = useState<string>('');
+  const [isCachedSuggestions, setIsCachedSuggestions] = useState(false);
   const [isLoading, setIsLoading] = useState(false);
 
-  const genAI = new GoogleGenerativeAI(process.env.REACT_APP_GEMINI_API_KEY || '');
-
   const checkBadges = useCallback(() => {
     const completedChallenges = challenges.filter(c => c.completed);
     const energyChallenges = completedChallenges.filter(c => c.category === 'energy').length;
@@ -183,71 +214,41 @@ const EcoChallenges: React.FC = () => {
     );
   };
 
-  const getDifficultyColor = (difficulty: string) => {
-    switch (difficulty) {
-      case 'easy': return '#4CAF50';
-      case 'medium': return '#FF9800';
-      case 'hard': return '#F44336';
-      default: return '#666';
-    }
-  };
+  const getDifficultyColor = (difficulty: string) => DIFFICULTY_COLORS[difficulty] || '#666';
 
-  const getCategoryIcon = (category: string) => {
-    switch (category) {
-      case 'energy': return '⚡';
-      case 'water': return '💧';
-      case 'carbon': return '🌱';
-      case 'waste': return '♻️';
-      default: return '🌍';
-    }
-  };
+  const getCategoryIcon = (category: string) => CATEGORY_ICONS[category] || '🌍';
 
-  const getCategoryColor = (category: string) => {
-    switch (category) {
-      case 'energy': return '#FFC107';
-      case 'water': return '#2196F3';
-      case 'carbon': return '#4CAF50';
-      case 'waste': return '#9C27B0';
-      default: return '#666';
-    }
-  };
+  const getCategoryColor = (category: string) => CATEGORY_COLORS[category] || '#666';
 
-  const getPersonalizedSuggestions = async () => {
+  const getPersonalizedSuggestions = async ({ noCache = false } = {}) => {
     setIsLoading(true);
+    setIsCachedSuggestions(false);
     try {
       if (!process.env.REACT_APP_GEMINI_API_KEY) {
         setAiSuggestions('AI features require a Gemini API key. Please add REACT_APP_GEMINI_API_KEY to your environment variables.');
         return;
       }
-      const model = genAI.getGenerativeModel({ model: 'gemini-pro' });
-      
-      const prompt = `
-        As a sustainability coach, analyze this user's progress:
-        
-        Total Points: ${totalPoints}
-        Completed Challenges: ${completedChallenges}
-        Challenges by Category:
-        ${challenges.reduce((acc, c) => {
-          if (c.completed) {
-            acc[c.category] = (acc[c.category] || 0) + 1;
-          }
-          return acc;
-        }, {} as Record<string, number>)}
-        
-        Please provide:
-        1. Personalized challenge recommendations based on their progress
-        2. Tips to stay motivated
-        3. Suggestions for new challenges they might enjoy
-        4. Ways to involve family/friends in sustainability efforts
-        
-        Format your response in an encouraging, actionable way.
-      `;
-
-      const result = await model.generateContent(prompt);
-      const response = await result.response;
-      setAiSuggestions(response.text());
+
+      const completedByCategory = challenges.reduce((acc, c) => {
+        if (c.completed) {
+          acc[c.category] = (acc[c.category] || 0) + 1;
+        }
+        return acc;
+      }, {} as Record<string, number>);
+
+      const prompt = [
+        "As a sustainability coach, analyze this user's progress:\n",
+        `Total Points: ${totalPoints}`,
+        `Completed Challenges: ${completedChallenges}`,
+        `Challenges by Category: ${JSON.stringify(completedByCategory)}`,
+        ECO_PROMPT_INSTRUCTIONS
+      ].join('\n');
+
+      // Stream the answer so the first suggestions render while the rest arrives
+      const { cached } = await generateCached(prompt, setAiSuggestions, { noCache });
+      setIsCachedSuggestions(cached);
     } catch (error) {
-      console.error('Error getting suggestions:', error);
+      logger.error('Error getting suggestions:', error);
       setAiSuggestions('Unable to generate suggestions at this time. Please try again later.');
     } finally {
       setIsLoading(false);
@@ -317,11 +318,11 @@ const EcoChallenges: React.FC = () => {
           <div className="challenges-header">
             <h3>Available Challenges</h3>
             <button 
-              onClick={getPersonalizedSuggestions}
+              onClick={() => getPersonalizedSuggestions({ noCache: isCachedSuggestions })}
               disabled={isLoading}
               className="suggestions-btn"
             >
-              {isLoading ? 'Getting Suggestions...' : 'Get AI Suggestions'}
+              {isLoading ? 'Getting Suggestions...' : isCachedSuggestions ? 'Regenerate Suggestions' : 'Get AI Suggestions'}
             </button>
           </div>
 
@@ -388,7 +389,10 @@ const EcoChallenges: React.FC = () => {
         </div>
 
         <div className="ai-suggestions">
-          <h3>AI-Powered Suggestions</h3>
+          <h3>
+            AI-Powered Suggestions
+            {isCachedSuggestions && <span className="cached-note">cached</span>}
+          </h3>
           <div className="suggestions-content">
             {aiSuggestions ? (
               <div className="suggestions-text">
@@ -1,4 +1,8 @@
 import React, { useState, useEffect } from 'react';
+import { SOLAR_API_URL, fetchWithRetry, isQuotaExceeded } from '../../lib/api';
+import { logger } from '../../lib/logger';
+import { RateLimiter } from '../../lib/rateLimiter';
+import { ResponseCache } from '../../lib/responseCache';
 import './SolarEnergy.css';
 
 interface Device {
@@ -24,6 +28,13 @@ interface ManagementPlan {
   alerts: string[];
 }
 
+interface SolarAnalysisRequest {
+  solar_production: number;
+  battery_percentage: number;
+  battery_capacity: number;
+  appliances: { [key: string]: number };
+}
+
 interface SolarAnalysisResponse {
   success: boolean;
   management_plan: ManagementPlan;
@@ -36,6 +47,52 @@ interface SolarAnalysisResponse {
   error?: string;
 }
 
+// Management plans keyed by the request body, shared across mounts, reloads
+// and tabs so re-analysing an unchanged setup doesn't go back to the backend.
+const planCache = new ResponseCache<ManagementPlan>(64, 30 * 60 * 1000, 'urjamitra:solar-plans');
+
+// Every cache miss costs the backend a Gemini call, so keep edits to the
+// inputs from bursting past the quota
+const analyzeLimiter = new RateLimiter(15, 60 * 1000);
+
+// Live readings are bucketed (100 W / 5 %) for the cache key so small
+// fluctuations reuse the current plan instead of triggering a new analysis.
+const getPlanCacheKey = (request: SolarAnalysisRequest) => JSON.stringify({
+  ...request,
+  solar_production: Math.round(request.solar_production / 100) * 100,
+  battery_percentage: Math.round(request.battery_percentage / 5) * 5
+});
+
+// Analyses in flight, keyed like the plan cache. Overlapping requests for the
+// same state (e.g. the debounced refresh and a button click) share one call.
+const pendingPlans = new Map<string, Promise<{ status: number; data: SolarAnalysisResponse }>>();
+
+const requestPlan = (cacheKey: string, requestBody: SolarAnalysisRequest) => {
+  const pending = pendingPlans.get(cacheKey);
+  if (pending) {
+    return pending;
+  }
+
+  const request = (async () => {
+    const response = await fetchWithRetry(`${SOLAR_API_URL}/api/solar/analyze`, {
+      method: 'POST',
+      headers: {
+        'Content-Type': 'application/json',
+      },
+      body: JSON.stringify(requestBody)
+    }, { beforeAttempt: () => analyzeLimiter.acquire() });
+    const data: SolarAnalysisResponse = await response.json();
+    return { status: response.status, data };
+  })().finally(() => pendingPlans.delete(cacheKey));
+
+  pendingPlans.set(cacheKey, request);
+  return request;
+};
+
+// Turns a power source label into a CSS class name, e.g. "Solar + Battery"
+const NON_ALPHA_RE = /[^a-z]/g;
+const toPowerSourceClass = (source: string) => source.toLowerCase().replace(NON_ALPHA_RE, '-');
+
 const SolarEnergy: React.FC = () => {
   const [solarCapacity, setSolarCapacity] = useState(5000); // watts
   const [currentProduction, setCurrentProduction] = useState(2500); // current solar production
@@ -51,6 +108,7 @@ const SolarEnergy: React.FC = () => {
     { id: '7', name: 'Laptop Charger', power: 65, duration: 8, priority: 7 },
   ]);
   const [managementPlan, setManagementPlan] = useState<ManagementPlan | null>(null);
+  const [isCachedPlan, setIsCachedPlan] = useState(false);
   const [isLoading, setIsLoading] = useState(false);
   const [error, setError] = useState<string>('');
 
@@ -58,7 +116,7 @@ const SolarEnergy: React.FC = () => {
     return devices.reduce((total, device) => total + (device.power * device.duration), 0);
   };
 
-  const getAIRecommendations = async () => {
+  const getAIRecommendations = async ({ noCache = false } = {}) => {
     setIsLoading(true);
     setError('');
     
@@ -69,42 +127,37 @@ const SolarEnergy: React.FC = () => {
         appliances[device.name] = device.power;
       });
 
-      const requestBody = {
+      const requestBody: SolarAnalysisRequest = {
         solar_production: currentProduction,
         battery_percentage: batteryLevel,
         battery_capacity: batteryCapacity,
         appliances: appliances
       };
 
-      const response = await fetch('http://localhost:5002/api/solar/analyze', {
-        method: 'POST',
-        headers: {
-          'Content-Type': 'application/json',
-        },
-        body: JSON.stringify(requestBody)
-      });
+      const cacheKey = getPlanCacheKey(requestBody);
+      const cachedPlan = noCache ? undefined : planCache.get(cacheKey);
+      if (cachedPlan) {
+        setManagementPlan(cachedPlan);
+        setIsCachedPlan(true);
+        return;
+      }
 
-      const data: SolarAnalysisResponse = await response.json();
+      const { status, data } = await requestPlan(cacheKey, requestBody);
 
       if (data.success && data.management_plan) {
+        planCache.set(cacheKey, data.management_plan);
         setManagementPlan(data.management_plan);
+        setIsCachedPlan(false);
       } else {
-        // Check for quota exceeded error in the error message
-        if (data.error && data.error.includes('429')) {
+        if (isQuotaExceeded(status, data.error)) {
           setError('⚠️ API quota exceeded. Solar analysis is temporarily in demo mode. Please try again later.');
         } else {
           setError(data.error || 'Failed to get AI recommendations');
         }
       }
     } catch (error) {
-      console.error('Error getting AI recommendations:', error);
-      
-      // Check if it's a quota error
-      if (error instanceof Error && error.message.includes('429')) {
-        setError('⚠️ API quota exceeded. Solar analysis is temporarily in demo mode. Please try again later.');
-      } else {
-        setError('Unable to connect to the solar analysis service. Please ensure the backend is running.');
-      }
+      logger.error('Error getting AI recommendations:', error);
+      setError('Unable to connect to the solar analysis service. Please ensure the backend is running.');
     } finally {
       setIsLoading(false);
     }
@@ -314,7 +367,7 @@ const SolarEnergy: React.FC = () => {
           <div className="section-header">
             <h3>AI Energy Management</h3>
             <button 
-              onClick={getAIRecommendations}
+              onClick={() => getAIRecommendations({ noCache: true })}
               disabled={isLoading}
               className="get-recommendations-btn"
             >
@@ -332,7 +385,10 @@ const SolarEnergy: React.FC = () => {
             {managementPlan ? (
               <div className="management-plan">
                 <div className="plan-section">
-                  <h4>📋 Summary</h4>
+                  <h4>
+                    📋 Summary
+                    {isCachedPlan && <span className="cached-plan-note">cached</span>}
+                  </h4>
                   <p className="summary">{managementPlan.recommendation_summary}</p>
                 </div>
                 
@@ -349,7 +405,7 @@ const SolarEnergy: React.FC = () => {
                         </div>
                         <div className="allocation-details">
                           <span className="time-slot">{item.time_to_run}</span>
-                          <span className={`power-source ${item.power_source.toLowerCase().replace(/[^a-z]/g, '-')}`}>
+                          <span className={`power-source ${toPowerSourceClass(item.power_source)}`}>
                             {item.power_source}
                           </span>
                         </div>
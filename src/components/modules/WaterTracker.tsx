@@ -1,5 +1,6 @@
 import React, { useState } from 'react';
-import { GoogleGenerativeAI } from '@google/generative-ai';
+import { generateCached } from '../../lib/gemini';
+import { logger } from '../../lib/logger';
 import './WaterTracker.css';
 
 interface WaterUsage {
@@ -11,15 +12,54 @@ interface WaterUsage {
   category: 'drinking' | 'cooking' | 'cleaning' | 'bathing' | 'other';
 }
 
+// Static part of the recommendations prompt, built once at module load
+const WATER_PROMPT_INSTRUCTIONS = `
+Please provide:
+1. Water conservation tips specific to their usage patterns
+2. Recommendations to improve water quality
+3. Suggestions to reduce water waste
+4. Health and safety advice for water consumption
+5. Ways to optimize their daily water goal
+
+Format your response in a clear, actionable way.`;
+
+// Display lookups, built once instead of switching on every render
+const WATER_QUALITY_COLORS: Readonly<Record<string, string>> = {
+  excellent: '#4CAF50',
+  good: '#8BC34A',
+  fair: '#FF9800',
+  poor: '#F44336'
+};
+
+const WATER_QUALITY_ICONS: Readonly<Record<string, string>> = {
+  excellent: '💧',
+  good: '💧',
+  fair: '⚠️',
+  poor: '🚨'
+};
+
+const CATEGORY_ICONS: Readonly<Record<string, string>> = {
+  drinking: '🥤',
+  cooking: '🍳',
+  cleaning: '🧽',
+  bathing: '🛁'
+};
+
+const CATEGORY_COLORS: Readonly<Record<string, string>> = {
+  drinking: '#4CAF50',
+  cooking: '#FF9800',
+  cleaning: '#2196F3',
+  bathing: '#9C27B0'
+};
+
 const WaterTracker: React.FC = () => {
   const [waterUsage, setWaterUsage] = useState<WaterUsage[]>([]);
   const [dailyGoal, setDailyGoal] = useState(150); // liters
   const [waterQuality] = useState<'excellent' | 'good' | 'fair' | 'poor'>('good');
   const [aiRecommendations, setAiRecommendations] = useState<string>('');
+  const [isCachedRecommendations, setIsCachedRecommendations] = useState(false);
   const [isLoading, setIsLoading] = useState(false);
 
-  const genAI = new GoogleGenerativeAI(process.env.REACT_APP_GEMINI_API_KEY || '');
-
   const totalUsage = waterUsage.reduce((sum, usage) => {
     const liters = usage.unit === 'gallons' ? usage.amount * 3.78541 : usage.amount;
     return sum + liters;
@@ -31,25 +71,9 @@ const WaterTracker: React.FC = () => {
     return acc;
   }, {} as Record<string, number>);
 
-  const getWaterQualityColor = (quality: string) => {
-    switch (quality) {
-      case 'excellent': return '#4CAF50';
-      case 'good': return '#8BC34A';
-      case 'fair': return '#FF9800';
-      case 'poor': return '#F44336';
-      default: return '#666';
-    }
-  };
+  const getWaterQualityColor = (quality: string) => WATER_QUALITY_COLORS[quality] || '#666';
 
-  const getWaterQualityIcon = (quality: string) => {
-    switch (quality) {
-      case 'excellent': return '💧';
-      case 'good': return '💧';
-      case 'fair': return '⚠️';
-      case 'poor': return '🚨';
-      default: return '💧';
-    }
-  };
+  const getWaterQualityIcon = (quality: string) => WATER_QUALITY_ICONS[quality] || '💧';
 
   const addWaterUsage = () => {
     const activity = prompt('Enter activity:');
@@ -70,38 +94,29 @@ const WaterTracker: React.FC = () => {
     }
   };
 
-  const getWaterRecommendations = async () => {
+  const getWaterRecommendations = async ({ noCache = false } = {}) => {
     setIsLoading(true);
+    setIsCachedRecommendations(false);
     try {
       if (!process.env.REACT_APP_GEMINI_API_KEY) {
         setAiRecommendations('AI features require a Gemini API key. Please add REACT_APP_GEMINI_API_KEY to your environment variables.');
         return;
       }
-      const model = genAI.getGenerativeModel({ model: 'gemini-pro' });
-      
-      const prompt = `
-        As a water conservation expert, analyze this household water usage:
-        
-        Daily Goal: ${dailyGoal} liters
-        Current Usage: ${totalUsage.toFixed(1)} liters
-        Usage by Category: ${JSON.stringify(usageByCategory, null, 2)}
-        Water Quality: ${waterQuality}
-        
-        Please provide:
-        1. Water conservation tips specific to their usage patterns
-        2. Recommendations to improve water quality
-        3. Suggestions to reduce water waste
-        4. Health and safety advice for water consumption
-        5. Ways to optimize their daily water goal
-        
-        Format your response in a clear, actionable way.
-      `;
 
-      const result = await model.generateContent(prompt);
-      const response = await result.response;
-      setAiRecommendations(response.text());
+      const prompt = [
+        'As a water conservation expert, analyze this household water usage:\n',
+        `Daily Goal: ${dailyGoal} liters`,
+        `Current Usage: ${totalUsage.toFixed(1)} liters`,
+        `Usage by Category: ${JSON.stringify(usageByCategory)}`,
+        `Water Quality: ${waterQuality}`,
+        WATER_PROMPT_INSTRUCTIONS
+      ].join('\n');
+
+      // Stream the answer so the first lines render while the rest arrives
+      const { cached } = await generateCached(prompt, setAiRecommendations, { noCache });
+      setIsCachedRecommendations(cached);
     } catch (error) {
-      console.error('Error getting water recommendations:', error);
+      logger.error('Error getting water recommendations:', error);
       setAiRecommendations('Unable to generate recommendations at this time. Please try again later.');
     } finally {
       setIsLoading(false);
@@ -112,25 +127,9 @@ const WaterTracker: React.FC = () => {
     setWaterUsage(waterUsage.filter(usage => usage.id !== id));
   };
 
-  const getCategoryIcon = (category: string) => {
-    switch (category) {
-      case 'drinking': return '🥤';
-      case 'cooking': return '🍳';
-      case 'cleaning': return '🧽';
-      case 'bathing': return '🛁';
-      default: return '💧';
-    }
-  };
+  const getCategoryIcon = (category: string) => CATEGORY_ICONS[category] || '💧';
 
-  const getCategoryColor = (category: string) => {
-    switch (category) {
-      case 'drinking': return '#4CAF50';
-      case 'cooking': return '#FF9800';
-      case 'cleaning': return '#2196F3';
-      case 'bathing': return '#9C27B0';
-      default: return '#666';
-    }
-  };
+  const getCategoryColor = (category: string) => CATEGORY_COLORS[category] || '#666';
 
   return (
     <div className="water-tracker">
@@ -269,13 +268,16 @@ const WaterTracker: React.FC = () => {
 
         <div className="ai-recommendations">
           <div className="section-header">
-            <h3>AI Water Recommendations</h3>
+            <h3>
+              AI Water Recommendations
+              {isCachedRecommendations && <span className="cached-note">cached</span>}
+            </h3>
             <button 
-              onClick={getWaterRecommendations}
+              onClick={() => getWaterRecommendations({ noCache: isCachedRecommendations })}
               disabled={isLoading}
               className="get-recommendations-btn"
             >
-              {isLoading ? 'Analyzing...' : 'Get Recommendations'}
+              {isLoading ? 'Analyzing...' : isCachedRecommendations ? 'Regenerate' : 'Get Recommendations'}
             </button>
           </div>
           
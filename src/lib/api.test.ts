@@ -0,0 +1,90 @@
+import { fetchWithRetry } from './api';
+
+const mockResponse = (status: number, headers: { [name: string]: string } = {}) =>
+  ({ status, headers: { get: (name: string) => headers[name] || null } } as unknown as Response);
+
+// Lets pending promise callbacks run after the fake clock moves
+const flushPromises = async () => {
+  for (let i = 0; i < 10; i++) {
+    await Promise.resolve();
+  }
+};
+
+const originalFetch = global.fetch;
+let fetchMock: jest.Mock;
+
+beforeEach(() => {
+  jest.useFakeTimers();
+  jest.spyOn(Math, 'random').mockReturnValue(0);
+  fetchMock = jest.fn();
+  global.fetch = fetchMock;
+});
+
+afterEach(() => {
+  jest.useRealTimers();
+  jest.restoreAllMocks();
+  global.fetch = originalFetch;
+});
+
+test('retries a 503 after backing off', async () => {
+  fetchMock.mockResolvedValueOnce(mockResponse(503)).mockResolvedValueOnce(mockResponse(200));
+
+  const result = fetchWithRetry('/api/test');
+  await flushPromises();
+  expect(fetchMock).toHaveBeenCalledTimes(1);
+
+  jest.advanceTimersByTime(500);
+  await flushPromises();
+  expect(fetchMock).toHaveBeenCalledTimes(2);
+  expect((await result).status).toBe(200);
+});
+
+test('does not retry a 500', async () => {
+  fetchMock.mockResolvedValue(mockResponse(500));
+
+  expect((await fetchWithRetry('/api/test')).status).toBe(500);
+  expect(fetchMock).toHaveBeenCalledTimes(1);
+});
+
+test('honours a short Retry-After', async () => {
+  fetchMock
+    .mockResolvedValueOnce(mockResponse(429, { 'Retry-After': '2' }))
+    .mockResolvedValueOnce(mockResponse(200));
+
+  const result = fetchWithRetry('/api/test');
+  await flushPromises();
+  jest.advanceTimersByTime(1999);
+  await flushPromises();
+  expect(fetchMock).toHaveBeenCalledTimes(1);
+
+  jest.advanceTimersByTime(1);
+  await flushPromises();
+  expect((await result).status).toBe(200);
+});
+
+test('returns instead of waiting out a long Retry-After', async () => {
+  fetchMock.mockResolvedValue(mockResponse(503, { 'Retry-After': '3600' }));
+
+  expect((await fetchWithRetry('/api/test')).status).toBe(503);
+  expect(fetchMock).toHaveBeenCalledTimes(1);
+});
+
+test('does not retry a 429 without Retry-After', async () => {
+  fetchMock.mockResolvedValue(mockResponse(429));
+
+  expect((await fetchWithRetry('/api/test')).status).toBe(429);
+  expect(fetchMock).toHaveBeenCalledTimes(1);
+});
+
+test('runs beforeAttempt before every attempt', async () => {
+  fetchMock.mockResolvedValueOnce(mockResponse(503)).mockResolvedValueOnce(mockResponse(200));
+  const beforeAttempt = jest.fn(() => Promise.resolve());
+
+  const result = fetchWithRetry('/api/test', undefined, { beforeAttempt });
+  await flushPromises();
+  jest.advanceTimersByTime(500);
+  await flushPromises();
+
+  expect((await result).status).toBe(200);
+  expect(beforeAttempt).toHaveBeenCalledTimes(2);
+});
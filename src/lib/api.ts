@@ -0,0 +1,97 @@
+// Flask backends for the carbon footprint pipeline and the solar planner
+export const CARBON_API_URL = 'http://localhost:5001';
+export const SOLAR_API_URL = 'http://localhost:5002';
+
+// Opens the connection to a backend ahead of its first request. Called when
+// the dashboard mounts rather than from index.html, so the login page and
+// other visitors don't connect to backends they never use.
+export const preconnect = (origin: string) => {
+  if (document.head.querySelector(`link[rel="preconnect"][href="${origin}"]`)) {
+    return;
+  }
+  const link = document.createElement('link');
+  link.rel = 'preconnect';
+  link.href = origin;
+  link.crossOrigin = '';
+  document.head.appendChild(link);
+};
+
+// Thrown for non-2xx backend responses. Keeps the HTTP status so callers can
+// branch on it instead of searching the message text.
+export class ApiError extends Error {
+  status: number;
+
+  constructor(message: string, status: number) {
+    super(message);
+    this.name = 'ApiError';
+    this.status = status;
+    Object.setPrototypeOf(this, ApiError.prototype);
+  }
+}
+
+// The backends wrap Gemini quota failures in their own error payloads, so the
+// upstream 429 may only show up in the message.
+export const isQuotaExceeded = (status?: number, message = '') =>
+  status === 429 || message.includes('429');
+
+// 500 is what the Flask backends return for application errors, so only
+// rate limiting and gateway/availability failures are treated as transient.
+const RETRYABLE_STATUS = [429, 502, 503, 504];
+
+// A longer Retry-After means the backend is out for longer than a user will
+// wait, so the response is returned for the caller's fallback to handle.
+const MAX_RETRY_AFTER_MS = 5000;
+
+const sleep = (ms: number) => new Promise(resolve => setTimeout(resolve, ms));
+
+const backoffDelay = (attempt: number) => 500 * 2 ** attempt + Math.random() * 100;
+
+// Delay before retrying the response, or null to return it as-is. A 429 is
+// only retried when the backend asks for a short wait; blindly retrying it
+// just burns more quota and holds up the demo-mode fallback.
+const getRetryDelay = (response: Response, attempt: number): number | null => {
+  if (RETRYABLE_STATUS.indexOf(response.status) === -1) {
+    return null;
+  }
+  const retryAfterMs = Number(response.headers.get('Retry-After')) * 1000;
+  if (retryAfterMs > 0) {
+    return retryAfterMs <= MAX_RETRY_AFTER_MS ? retryAfterMs : null;
+  }
+  return response.status === 429 ? null : backoffDelay(attempt);
+};
+
+interface RetryOptions {
+  retries?: number;
+  // Runs before every attempt, e.g. to take a rate limiter token per request
+  beforeAttempt?: () => Promise<void>;
+}
+
+// fetch() with exponential backoff and jitter on network errors and transient
+// statuses. A short Retry-After header on the response takes precedence.
+export const fetchWithRetry = async (
+  input: RequestInfo,
+  init?: RequestInit,
+  { retries = 2, beforeAttempt }: RetryOptions = {}
+): Promise<Response> => {
+  for (let attempt = 0; ; attempt++) {
+    if (beforeAttempt) {
+      await beforeAttempt();
+    }
+    let response: Response;
+    try {
+      response = await fetch(input, init);
+    } catch (error) {
+      if (attempt >= retries) {
+        throw error;
+      }
+      await sleep(backoffDelay(attempt));
+      continue;
+    }
+
+    const delay = attempt < retries ? getRetryDelay(response, attempt) : null;
+    if (delay === null) {
+      return response;
+    }
+    await sleep(delay);
+  }
+};
@@ -0,0 +1,53 @@
+import { GoogleGenerativeAI } from '@google/generative-ai';
+import { RateLimiter } from './rateLimiter';
+import { ResponseCache } from './responseCache';
+
+// Shared across all modules instead of being rebuilt on every render
+export const genAI = new GoogleGenerativeAI(process.env.REACT_APP_GEMINI_API_KEY || '');
+
+// Single model used by every module, overridable per deployment
+export const GEMINI_MODEL = process.env.REACT_APP_GEMINI_MODEL || 'gemini-pro';
+
+// Model handle shared by every module instead of being created per request
+export const geminiModel = genAI.getGenerativeModel({ model: GEMINI_MODEL });
+
+// Matches the free-tier quota of 15 requests per minute
+export const geminiLimiter = new RateLimiter(15, 60 * 1000);
+
+// Generated text keyed by model + prompt, shared across reloads and tabs, so
+// asking again about unchanged data doesn't cost another Gemini call
+export const geminiCache = new ResponseCache<string>(64, 30 * 60 * 1000, 'urjamitra:gemini');
+
+export const getGeminiCacheKey = (prompt: string) => `${GEMINI_MODEL}:${prompt}`;
+
+// Streams an answer for the prompt through the shared cache and rate limiter.
+// onText gets the text so far as chunks arrive. The full text is returned
+// along with whether it came from the cache, so callers can label it and
+// offer a fresh answer with noCache.
+export const generateCached = async (
+  prompt: string,
+  onText: (text: string) => void,
+  { noCache = false } = {}
+) => {
+  const cacheKey = getGeminiCacheKey(prompt);
+  const cached = noCache ? undefined : geminiCache.get(cacheKey);
+  if (cached) {
+    onText(cached);
+    return { text: cached, cached: true };
+  }
+
+  await geminiLimiter.acquire();
+  const { stream, response } = await geminiModel.generateContentStream(prompt);
+  // response reads its own branch of the stream. A failure partway already
+  // rejects stream.next() below, so don't leave this copy unhandled
+  response.catch(() => undefined);
+  let text = '';
+  for (let chunk = await stream.next(); !chunk.done; chunk = await stream.next()) {
+    text += chunk.value.text();
+    onText(text);
+  }
+  const finalText = (await response).text();
+  onText(finalText);
+  geminiCache.set(cacheKey, finalText);
+  return { text: finalText, cached: false };
+};
@@ -0,0 +1,19 @@
+const isProduction = process.env.NODE_ENV === 'production';
+
+// Level-gated console wrapper: debug and info output is dropped from
+// production builds, errors are always reported.
+export const logger = {
+  debug: (...args: unknown[]) => {
+    if (!isProduction) {
+      console.debug(...args);
+    }
+  },
+  info: (...args: unknown[]) => {
+    if (!isProduction) {
+      console.info(...args);
+    }
+  },
+  error: (...args: unknown[]) => {
+    console.error(...args);
+  }
+};
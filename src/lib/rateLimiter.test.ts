@@ -0,0 +1,57 @@
+import { RateLimiter } from './rateLimiter';
+
+// Lets pending promise callbacks run after the fake clock moves
+const flushPromises = async () => {
+  for (let i = 0; i < 10; i++) {
+    await Promise.resolve();
+  }
+};
+
+beforeEach(() => {
+  jest.useFakeTimers();
+});
+
+afterEach(() => {
+  jest.useRealTimers();
+});
+
+test('allows a burst, then waits for the next token', async () => {
+  const limiter = new RateLimiter(2, 1000);
+  await limiter.acquire();
+  await limiter.acquire();
+
+  let acquired = false;
+  limiter.acquire().then(() => {
+    acquired = true;
+  });
+  await flushPromises();
+  expect(acquired).toBe(false);
+
+  jest.advanceTimersByTime(499);
+  await flushPromises();
+  expect(acquired).toBe(false);
+
+  jest.advanceTimersByTime(1);
+  await flushPromises();
+  expect(acquired).toBe(true);
+});
+
+test('only waits for the missing fraction of a token', async () => {
+  const limiter = new RateLimiter(2, 1000);
+  await limiter.acquire();
+  await limiter.acquire();
+  // Half a token refills in 250 ms
+  jest.advanceTimersByTime(250);
+
+  let acquired = false;
+  limiter.acquire().then(() => {
+    acquired = true;
+  });
+  jest.advanceTimersByTime(249);
+  await flushPromises();
+  expect(acquired).toBe(false);
+
+  jest.advanceTimersByTime(1);
+  await flushPromises();
+  expect(acquired).toBe(true);
+});
@@ -0,0 +1,30 @@
+// Token bucket limiter: allows bursts of up to `maxRequests` and refills at
+// `maxRequests` per `periodMs`. acquire() waits for a token instead of
+// letting a burst run into the Gemini quota and come back as 429s.
+export class RateLimiter {
+  private tokens: number;
+  private lastRefill = Date.now();
+
+  constructor(private maxRequests: number, private periodMs: number) {
+    this.tokens = maxRequests;
+  }
+
+  async acquire() {
+    for (;;) {
+      this.refill();
+      if (this.tokens >= 1) {
+        this.tokens -= 1;
+        return;
+      }
+      const waitMs = ((1 - this.tokens) * this.periodMs) / this.maxRequests;
+      await new Promise(resolve => setTimeout(resolve, waitMs));
+    }
+  }
+
+  private refill() {
+    const now = Date.now();
+    const refilled = ((now - this.lastRefill) * this.maxRequests) / this.periodMs;
+    this.tokens = Math.min(this.maxRequests, this.tokens + refilled);
+    this.lastRefill = now;
+  }
+}
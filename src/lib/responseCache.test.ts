@@ -0,0 +1,98 @@
+import { ResponseCache } from './responseCache';
+
+afterEach(() => {
+  jest.useRealTimers();
+  window.localStorage.clear();
+});
+
+describe('LRU eviction', () => {
+  test('evicts the least recently used entry', () => {
+    const cache = new ResponseCache<number>(2);
+    cache.set('a', 1);
+    cache.set('b', 2);
+    cache.get('a');
+    cache.set('c', 3);
+
+    expect(cache.get('a')).toBe(1);
+    expect(cache.get('b')).toBeUndefined();
+    expect(cache.get('c')).toBe(3);
+  });
+
+  test('overwriting a key does not evict another entry', () => {
+    const cache = new ResponseCache<number>(2);
+    cache.set('a', 1);
+    cache.set('b', 2);
+    cache.set('a', 10);
+
+    expect(cache.get('a')).toBe(10);
+    expect(cache.get('b')).toBe(2);
+  });
+});
+
+describe('TTL', () => {
+  test('expires entries after the TTL', () => {
+    jest.useFakeTimers();
+    const cache = new ResponseCache<number>(10, 1000);
+    cache.set('a', 1);
+
+    jest.advanceTimersByTime(999);
+    expect(cache.get('a')).toBe(1);
+    jest.advanceTimersByTime(2);
+    expect(cache.get('a')).toBeUndefined();
+  });
+
+  test('setting a key again restarts its TTL', () => {
+    jest.useFakeTimers();
+    const cache = new ResponseCache<number>(10, 1000);
+    cache.set('a', 1);
+    jest.advanceTimersByTime(800);
+    cache.set('a', 2);
+    jest.advanceTimersByTime(800);
+
+    expect(cache.get('a')).toBe(2);
+  });
+});
+
+describe('localStorage', () => {
+  test('restores entries when given a storage key', () => {
+    new ResponseCache<number>(10, 1000, 'test-cache').set('a', 1);
+
+    expect(new ResponseCache<number>(10, 1000, 'test-cache').get('a')).toBe(1);
+    expect(new ResponseCache<number>(10, 1000).get('a')).toBeUndefined();
+  });
+
+  test('merges with entries other instances stored', () => {
+    const tabA = new ResponseCache<number>(10, 1000, 'test-cache');
+    const tabB = new ResponseCache<number>(10, 1000, 'test-cache');
+    tabA.set('a', 1);
+    tabB.set('b', 2);
+
+    const reloaded = new ResponseCache<number>(10, 1000, 'test-cache');
+    expect(reloaded.get('a')).toBe(1);
+    expect(reloaded.get('b')).toBe(2);
+  });
+
+  test('keeps the later write when two instances store the same key', () => {
+    jest.useFakeTimers();
+    const tabA = new ResponseCache<number>(10, 1000, 'test-cache');
+    const tabB = new ResponseCache<number>(10, 1000, 'test-cache');
+    tabA.set('a', 1);
+    jest.advanceTimersByTime(10);
+    tabB.set('a', 2);
+    // Any later write from tab A must not put its stale copy back
+    tabA.set('b', 3);
+
+    const reloaded = new ResponseCache<number>(10, 1000, 'test-cache');
+    expect(reloaded.get('a')).toBe(2);
+    expect(reloaded.get('b')).toBe(3);
+    expect(tabA.get('a')).toBe(2);
+  });
+
+  test('clear() removes the stored entries', () => {
+    const cache = new ResponseCache<number>(10, 1000, 'test-cache');
+    cache.set('a', 1);
+    cache.clear();
+
+    expect(new ResponseCache<number>(10, 1000, 'test-cache').get('a')).toBeUndefined();
+  });
+});
@@ -0,0 +1,119 @@
+interface CacheEntry<T> {
+  value: T;
+  expiresAt: number;
+}
+
+// Small LRU cache with a per-entry TTL, used to avoid repeating identical
+// backend / Gemini requests. Map keeps insertion order, so the first key is
+// always the least recently used one. When a storage key is given, entries
+// are mirrored to localStorage so reloads and other tabs reuse them; writes
+// merge with what other tabs stored instead of overwriting it.
+export class ResponseCache<T> {
+  private entries = new Map<string, CacheEntry<T>>();
+
+  constructor(
+    private maxSize = 128,
+    private ttlMs = 60 * 60 * 1000,
+    private storageKey?: string
+  ) {
+    if (this.storageKey) {
+      this.mergeStored();
+      window.addEventListener('storage', event => {
+        if (event.key === this.storageKey) {
+          this.mergeStored();
+        }
+      });
+    }
+  }
+
+  get(key: string): T | undefined {
+    const entry = this.entries.get(key);
+    if (!entry) {
+      return undefined;
+    }
+    if (entry.expiresAt <= Date.now()) {
+      this.entries.delete(key);
+      return undefined;
+    }
+    // Re-insert to mark the entry as most recently used
+    this.entries.delete(key);
+    this.entries.set(key, entry);
+    return entry.value;
+  }
+
+  set(key: string, value: T) {
+    this.entries.delete(key);
+    this.entries.set(key, { value, expiresAt: Date.now() + this.ttlMs });
+    this.trim();
+    this.persist();
+  }
+
+  clear() {
+    this.entries.clear();
+    if (!this.storageKey) {
+      return;
+    }
+    try {
+      window.localStorage.removeItem(this.storageKey);
+    } catch (error) {
+      // Storage disabled; nothing was persisted
+    }
+  }
+
+  private trim() {
+    while (this.entries.size > this.maxSize) {
+      const oldestKey = this.entries.keys().next().value;
+      if (oldestKey === undefined) {
+        return;
+      }
+      this.entries.delete(oldestKey);
+    }
+  }
+
+  // Pulls in unexpired entries other tabs have stored as the least recently
+  // used ones. Keys already held here keep their position; every entry shares
+  // the same TTL, so whichever copy expires later was written last and wins.
+  private mergeStored() {
+    if (!this.storageKey) {
+      return;
+    }
+    const merged = new Map<string, CacheEntry<T>>();
+    const newer = new Map<string, CacheEntry<T>>();
+    try {
+      const stored = window.localStorage.getItem(this.storageKey);
+      const now = Date.now();
+      if (stored) {
+        (JSON.parse(stored) as Array<[string, CacheEntry<T>]>).forEach(([key, entry]) => {
+          const local = this.entries.get(key);
+          if (entry.expiresAt <= now) {
+            return;
+          }
+          if (!local) {
+            merged.set(key, entry);
+          } else if (entry.expiresAt > local.expiresAt) {
+            newer.set(key, entry);
+          }
+        });
+      }
+    } catch (error) {
+      // Storage unavailable or holding stale data; keep what we have
+    }
+    this.entries.forEach((entry, key) => merged.set(key, newer.get(key) || entry));
+    this.entries = merged;
+    this.trim();
+  }
+
+  private persist() {
+    if (!this.storageKey) {
+      return;
+    }
+    this.mergeStored();
+    try {
+      const stored: Array<[string, CacheEntry<T>]> = [];
+      this.entries.forEach((entry, key) => stored.push([key, entry]));
+      window.localStorage.setItem(this.storageKey, JSON.stringify(stored));
+    } catch (error) {
+      // Quota exceeded or storage disabled; the in-memory cache still works
+    }
+  }
+}